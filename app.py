@@ -1,12 +1,18 @@
-from flask import Flask, Response, request, jsonify, render_template
+from flask import Flask, Response, request, render_template, send_file
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import InternalServerError
 from prometheus_client import (
     generate_latest,
+    CollectorRegistry,
+    REGISTRY,
     CONTENT_TYPE_LATEST,
     Gauge,
     Counter,
     Histogram,
     Info,
+    disable_created_metrics,
 )
+from prometheus_client.utils import floatToGoString
 import psutil
 import time
 from datetime import datetime, timedelta, timezone
@@ -14,13 +20,31 @@ import threading
 import re
 import math
 import os
-import json
-from urllib import request as urlrequest
-from urllib.error import URLError, HTTPError
+import sys
+import atexit
+import tempfile
+import shutil
+import stat
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from collections import namedtuple
+import asyncio
+import aiohttp
+import orjson
+
+
+class _OrjsonProvider(JSONProvider):
+    """요청 본문 파싱(request.get_json)과 app.json 직렬화를 orjson으로 처리한다."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = _OrjsonProvider(app)
+app.config['TEMPLATES_AUTO_RELOAD'] = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +63,10 @@ DEFAULT_STATUS = {
 _status_state = DEFAULT_STATUS.copy()
 _status_lock = threading.Lock()
 
+# Counter/Histogram마다 붙는 *_created 시계열을 만들지 않는다(메트릭 정의 전에 호출해야 적용됨).
+# PROMETHEUS_DISABLE_CREATED_SERIES 환경 변수를 지정한 것과 같다.
+disable_created_metrics()
+
 # 시스템 메트릭 Gauge들
 g_camera_value = Gauge('camera_value', 'Camera status value')
 g_ocr_seconds = Gauge('ocr_value_seconds', 'OCR timestamp converted to seconds')
@@ -47,41 +75,181 @@ g_hdmi_value = Gauge('hdmi_value', 'HDMI status value')
 g_ac_value = Gauge('ac_value', 'AC power status value')
 g_dc_value = Gauge('dc_value', 'DC power status value')
 
+# 거의 변하지 않는 메트릭은 별도 레지스트리에 두고 /metrics/slow로 노출
+slow_registry = CollectorRegistry()
+
 g_cpu = Gauge('system_cpu_percent', 'System CPU usage percent')
 g_mem = Gauge('system_memory_percent', 'System memory usage percent')
 g_mem_available = Gauge('system_memory_available_bytes', 'Available memory in bytes')
-g_mem_total = Gauge('system_memory_total_bytes', 'Total memory in bytes')
+g_mem_total = Gauge('system_memory_total_bytes', 'Total memory in bytes', registry=slow_registry)
 g_mem_used = Gauge('system_memory_used_bytes', 'Used memory in bytes')
 
 # 디스크 메트릭
-g_disk_usage = Gauge('system_disk_usage_percent', 'Disk usage percent', ['device', 'mountpoint'])
-g_disk_free = Gauge('system_disk_free_bytes', 'Free disk space in bytes', ['device', 'mountpoint'])
-g_disk_total = Gauge('system_disk_total_bytes', 'Total disk space in bytes', ['device', 'mountpoint'])
+g_disk_usage = Gauge('system_disk_usage_percent', 'Disk usage percent', ['mountpoint'])
+g_disk_free = Gauge(
+    'system_disk_free_bytes', 'Free disk space in bytes', ['mountpoint'], registry=slow_registry
+)
+g_disk_total = Gauge(
+    'system_disk_total_bytes', 'Total disk space in bytes', ['mountpoint'], registry=slow_registry
+)
 
 # 네트워크 메트릭
-g_network_bytes_sent = Gauge('system_network_bytes_sent', 'Network bytes sent', ['interface'])
-g_network_bytes_recv = Gauge('system_network_bytes_recv', 'Network bytes received', ['interface'])
-g_network_packets_sent = Gauge('system_network_packets_sent', 'Network packets sent', ['interface'])
-g_network_packets_recv = Gauge('system_network_packets_recv', 'Network packets received', ['interface'])
+# 누적 값이므로 Counter로 노출(<이름>_total)하여 rate()/increase()로 조회
+network_bytes_sent_total = Counter('system_network_bytes_sent', 'Network bytes sent', ['interface'])
+network_bytes_recv_total = Counter('system_network_bytes_recv', 'Network bytes received', ['interface'])
+network_packets_sent_total = Counter('system_network_packets_sent', 'Network packets sent', ['interface'])
+network_packets_recv_total = Counter('system_network_packets_recv', 'Network packets received', ['interface'])
 
 # 프로세스 메트릭
 g_process_count = Gauge('system_process_count', 'Number of processes')
 g_thread_count = Gauge('system_thread_count', 'Number of threads')
 
 # 부팅 시간
-g_boot_time = Gauge('system_boot_time_seconds', 'System boot time in seconds')
+g_boot_time = Gauge('system_boot_time_seconds', 'System boot time in seconds', registry=slow_registry)
 
 # HTTP 요청 메트릭
 http_requests_total = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
-http_request_duration = Histogram('http_request_duration_seconds', 'HTTP request duration in seconds')
+# 관측마다 버킷 전체를 순회하므로 버킷은 최소한으로 유지하고,
+# 준비된 본문만 돌려주는 /metrics 계열과 / 에는 적용하지 않는다(/status 계열만 측정)
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request duration in seconds',
+    buckets=(0.01, 0.1, 1.0),
+)
+
+# (method, endpoint)별로 발생 가능한 status의 요청 카운터 자식을 미리 생성
+# (요청마다 labels() 조회/락을 피하고, 예외 경로인 500도 동적 조회 없이 집계)
+_REQ = {
+    (method, endpoint): {
+        status: http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+        for status in statuses
+    }
+    for method, endpoint, statuses in (
+        ('GET', '/metrics', ('200', '500', '503')),
+        ('GET', '/metrics/full', ('200', '500')),
+        ('GET', '/metrics/slow', ('200', '500')),
+        ('POST', '/status', ('200', '400', '500')),
+        ('GET', '/status', ('200', '500')),
+        ('GET', '/status/update', ('200', '400', '500')),
+        ('GET', '/', ('200', '500')),
+    )
+}
+
+# 핸들러에서 바로 쓰는 자식 카운터
+_req_metrics_200 = _REQ[('GET', '/metrics')]['200']
+_req_metrics_503 = _REQ[('GET', '/metrics')]['503']
+_req_metrics_full_200 = _REQ[('GET', '/metrics/full')]['200']
+_req_metrics_slow_200 = _REQ[('GET', '/metrics/slow')]['200']
+_req_status_post_200 = _REQ[('POST', '/status')]['200']
+_req_status_post_400 = _REQ[('POST', '/status')]['400']
+_req_status_get_200 = _REQ[('GET', '/status')]['200']
+_req_status_update_200 = _REQ[('GET', '/status/update')]['200']
+_req_status_update_400 = _REQ[('GET', '/status/update')]['400']
+_req_index_200 = _REQ[('GET', '/')]['200']
 
 
-OCR_PATTERN = re.compile(r'^\d{1,2}:\d{2}:\d{2}$')
+OCR_PATTERN = re.compile(r'^(\d{1,2}):(\d{2}):(\d{2})$')
+
+# /metrics 응답 본문 파일. 수집 스레드가 직렬화해 원자적으로 교체하고
+# 요청 경로에서는 파일을 그대로 전송한다(재직렬화 없음, sendfile 경로 사용).
+# 고정 경로는 심볼릭 링크 공격/다른 인스턴스와의 충돌 위험이 있으므로
+# 프로세스 전용 임시 디렉터리(0700)를 시작 시 한 번 만들어 사용한다.
+# 이름에 PID를 넣어, 다음 시작 시 종료된 프로세스가 남긴 디렉터리만 골라 정리한다.
+_METRICS_DIR_PREFIX = 'visionix-metrics-'
+
+
+def _remove_stale_metrics_dirs():
+    """atexit 없이 종료된(SIGKILL 등) 이전 실행이 남긴 메트릭 디렉터리를 삭제한다."""
+    uid = os.getuid() if hasattr(os, 'getuid') else None
+    try:
+        entries = list(os.scandir(tempfile.gettempdir()))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith(_METRICS_DIR_PREFIX):
+            continue
+        try:
+            pid = int(entry.name[len(_METRICS_DIR_PREFIX):].split('-', 1)[0])
+        except ValueError:
+            continue
+        # 실행 중인 다른 인스턴스의 디렉터리는 건드리지 않는다(같은 PID는 이전 컨테이너 실행 등)
+        if pid != os.getpid() and psutil.pid_exists(pid):
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        if not stat.S_ISDIR(st.st_mode) or (uid is not None and st.st_uid != uid):
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+_remove_stale_metrics_dirs()
+_METRICS_DIR = tempfile.mkdtemp(prefix=f'{_METRICS_DIR_PREFIX}{os.getpid()}-')
+METRICS_FILE_PATH = os.path.join(_METRICS_DIR, 'metrics.prom')
+_metrics_file_lock = threading.Lock()
+
+# 1이면 /metrics 본문을 알려진 게이지만으로 직접 작성(generate_latest 범용 경로 생략).
+# 전체 레지스트리 출력은 /metrics/full에서 항상 제공한다.
+METRICS_FAST_RENDER = os.getenv('METRICS_FAST_RENDER', '0') == '1'
 
 # 고정 KST(+09:00) 타임존
 KST = timezone(timedelta(hours=9))
 
 
+def _ttl_cache(fn, ttl: float):
+    """fn 결과를 ttl 초 동안 재사용하는 래퍼를 반환한다."""
+    ts = None
+    value = None
+
+    def wrapper():
+        nonlocal ts, value
+        now = time.monotonic()
+        if ts is None or now - ts >= ttl:
+            value = fn()
+            ts = now
+        return value
+
+    return wrapper
+
+
+# 오늘 KST 자정의 에폭 초. 날짜가 바뀌었을 때만 다시 계산한다(KST는 서머타임이 없어 하루는 항상 86400초)
+_KST_OFFSET_SECONDS = 9 * 3600
+_today_midnight_epoch = None
+
+
+def _kst_midnight_epoch(now: float) -> int:
+    global _today_midnight_epoch
+    midnight = _today_midnight_epoch
+    if midnight is None or not 0 <= now - midnight < 86400:
+        midnight = int((now + _KST_OFFSET_SECONDS) // 86400) * 86400 - _KST_OFFSET_SECONDS
+        _today_midnight_epoch = midnight
+    return midnight
+
+
+def _parse_hms(value: str):
+    """HH:MM:SS(또는 H:MM:SS) 문자열을 (시, 분, 초)로 파싱한다. 형식이 아니면 None."""
+    value = value.strip()
+    # 시(1~2자리)를 포함한 유효 길이는 7 또는 8뿐이므로 그 외는 바로 거부
+    if len(value) not in (7, 8):
+        return None
+    # 대부분의 입력은 정규식 없이 문자 위치만으로 판정
+    if (
+        value[-3] == ':'
+        and value[-6] == ':'
+        and value.count(':') == 2
+        and value.isascii()
+        and value.replace(':', '').isdigit()
+    ):
+        return int(value[:-6]), int(value[-5:-3]), int(value[-2:])
+    # 그 외 형태는 기존 정규식으로 판정
+    match = OCR_PATTERN.match(value)
+    if match is None:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours), int(minutes), int(seconds)
+
+
 def _hms_to_seconds(value: str) -> int:
     hours, minutes, seconds = value.split(':')
     return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
@@ -95,19 +263,10 @@ def _seconds_to_hms(value: int) -> str:
     return f"{hours:02d}:{minutes:02d}:{remaining:02d}"
 
 
-def _hms_kst_to_epoch_seconds(value: str) -> int:
-    hours, minutes, seconds = map(int, value.split(':'))
-    today_kst = datetime.now(tz=KST).date()
-    dt_kst = datetime(
-        year=today_kst.year,
-        month=today_kst.month,
-        day=today_kst.day,
-        hour=hours,
-        minute=minutes,
-        second=seconds,
-        tzinfo=KST,
-    )
-    return int(dt_kst.timestamp())
+def _hms_kst_to_epoch_seconds(hours: int, minutes: int, seconds: int) -> int:
+    if not (hours < 24 and minutes < 60 and seconds < 60):
+        raise ValueError('ocr_value must be a valid time of day (00:00:00-23:59:59)')
+    return _kst_midnight_epoch(time.time()) + hours * 3600 + minutes * 60 + seconds
 
 
 def _epoch_seconds_to_hms_kst(epoch_seconds: int) -> str:
@@ -118,68 +277,131 @@ def _epoch_seconds_to_hms_kst(epoch_seconds: int) -> str:
     return dt_kst.strftime("%H:%M:%S")
 
 
+def _set_ocr_metric(value):
+    # value는 이제 '에폭 초'로 저장/표시
+    info_ocr_value.info({'value': _epoch_seconds_to_hms_kst(value)})
+    g_ocr_seconds.set(value)
+
+
+# 필드별 메트릭 setter (if/elif 대신 딕셔너리 조회로 분기)
+_METRIC_SETTERS = {
+    'camera_value': g_camera_value.set,
+    'ocr_value': _set_ocr_metric,
+    'hdmi_value': g_hdmi_value.set,
+    'ac_value': g_ac_value.set,
+    'dc_value': g_dc_value.set,
+}
+
+
 def _update_metric(field: str, value):
-    if field == 'camera_value':
-        g_camera_value.set(value)
-    elif field == 'ocr_value':
-        # value는 이제 '에폭 초'로 저장/표시
-        info_ocr_value.info({'value': _epoch_seconds_to_hms_kst(value)})
-        g_ocr_seconds.set(value)
-    elif field == 'hdmi_value':
-        g_hdmi_value.set(value)
-    elif field == 'ac_value':
-        g_ac_value.set(value)
-    elif field == 'dc_value':
-        g_dc_value.set(value)
+    setter = _METRIC_SETTERS.get(field)
+    if setter is not None:
+        setter(value)
 
 
 def _set_status(field: str, value):
+    global _status_state
     with _status_lock:
-        _status_state[field] = value
-    _update_metric(field, value)
+        # 값이 같으면 상태 교체와 메트릭 갱신(클라이언트 락 획득)을 모두 생략
+        if _status_state.get(field) == value:
+            return
+        # 쓰기 시 새 딕셔너리로 교체(copy-on-write)하여 읽기 측은 락 없이 참조
+        state = dict(_status_state)
+        state[field] = value
+        _status_state = state
+        # 상태와 메트릭의 갱신 순서가 스레드 간에 엇갈리지 않도록 같은 락 안에서 반영
+        _update_metric(field, value)
 
 
 def _get_status_snapshot():
-    with _status_lock:
-        return dict(_status_state)
+    # 반환된 딕셔너리는 공유 스냅샷이므로 수정하지 않는다
+    return _status_state
 
 
-def _validate_and_cast(field: str, raw_value):
-    if field == 'ocr_value':
-        if isinstance(raw_value, str):
-            if not OCR_PATTERN.match(raw_value):
-                raise ValueError('ocr_value must follow HH:MM:SS format')
-            # 문자열(HH:MM:SS)은 '오늘 KST 기준 시각'으로 간주하여 에폭 초로 변환
-            value = _hms_kst_to_epoch_seconds(raw_value)
-        elif isinstance(raw_value, (int, float)):
-            if not math.isfinite(raw_value):
-                raise ValueError('ocr_value must be a finite number or HH:MM:SS string')
-            # 숫자는 '에폭 초'로 간주
-            value = int(raw_value)
-        else:
-            raise ValueError('ocr_value must be a HH:MM:SS string or number of seconds')
-        if value < 0:
-            raise ValueError('ocr_value must be zero or positive')
-        return value
+def _parse_ocr_string(raw_value: str) -> int:
+    parts = _parse_hms(raw_value)
+    if parts is None:
+        raise ValueError('ocr_value must follow HH:MM:SS format')
+    # 문자열(HH:MM:SS)은 '오늘 KST 기준 시각'으로 간주하여 에폭 초로 변환
+    return _hms_kst_to_epoch_seconds(*parts)
+
 
+def _parse_ocr_number(raw_value) -> int:
+    if not math.isfinite(raw_value):
+        raise ValueError('ocr_value must be a finite number or HH:MM:SS string')
+    # 숫자는 '에폭 초'로 간주
+    return int(raw_value)
+
+
+# 입력 타입별 ocr_value 변환 함수 (isinstance 분기 대신 type 조회로 분기, bool은 거부)
+_OCR_PARSERS = {
+    str: _parse_ocr_string,
+    int: _parse_ocr_number,
+    float: _parse_ocr_number,
+}
+
+
+# orjson은 64비트를 넘는 정수를 직렬화하지 못하므로 저장 전에 범위를 제한한다
+_MAX_STATUS_INT = 2 ** 63 - 1
+
+
+def _validate_ocr(field: str, raw_value):
+    parser = _OCR_PARSERS.get(type(raw_value))
+    if parser is None:
+        raise ValueError('ocr_value must be a HH:MM:SS string or number of seconds')
+    value = parser(raw_value)
+    if value < 0:
+        raise ValueError('ocr_value must be zero or positive')
+    if value > _MAX_STATUS_INT:
+        raise ValueError(f'ocr_value must be at most {_MAX_STATUS_INT}')
+    return value
+
+
+def _cast_int(field: str, raw_value) -> int:
     try:
-        value = int(raw_value)
+        return int(raw_value)
     except (TypeError, ValueError) as exc:
         raise ValueError(f'{field} must be an integer') from exc
 
-    if field == 'camera_value':
-        if value < 0:
-            raise ValueError('camera_value must be zero or positive')
-        return value
-    if field == 'hdmi_value':
-        if value not in {0, 1, 2, 3}:
-            raise ValueError('hdmi_value must be one of 0, 1, 2, 3')
-        return value
-    if field in {'ac_value', 'dc_value'}:
-        if value not in {0, 1}:
-            raise ValueError(f'{field} must be either 0 or 1')
-        return value
-    raise ValueError(f'Unsupported field: {field}')
+
+def _validate_nonneg_int(field: str, raw_value):
+    value = _cast_int(field, raw_value)
+    if value < 0:
+        raise ValueError(f'{field} must be zero or positive')
+    if value > _MAX_STATUS_INT:
+        raise ValueError(f'{field} must be at most {_MAX_STATUS_INT}')
+    return value
+
+
+def _validate_hdmi(field: str, raw_value):
+    value = _cast_int(field, raw_value)
+    if value not in {0, 1, 2, 3}:
+        raise ValueError(f'{field} must be one of 0, 1, 2, 3')
+    return value
+
+
+def _validate_bit(field: str, raw_value):
+    value = _cast_int(field, raw_value)
+    if value not in {0, 1}:
+        raise ValueError(f'{field} must be either 0 or 1')
+    return value
+
+
+# 필드별 검증/변환 함수
+_VALIDATORS = {
+    'camera_value': _validate_nonneg_int,
+    'ocr_value': _validate_ocr,
+    'hdmi_value': _validate_hdmi,
+    'ac_value': _validate_bit,
+    'dc_value': _validate_bit,
+}
+
+
+def _validate_and_cast(field: str, raw_value):
+    validator = _VALIDATORS.get(field)
+    if validator is None:
+        raise ValueError(f'Unsupported field: {field}')
+    return validator(field, raw_value)
 
 
 def _apply_updates(data: dict):
@@ -194,35 +416,426 @@ def _apply_updates(data: dict):
     return updated_fields
 
 
-def collect_system_metrics():
-    cpu_percent = psutil.cpu_percent(interval=None)
-    g_cpu.set(cpu_percent)
+# 용량 의미가 없는 가상 파일시스템 (statvfs 호출 생략)
+_PSEUDO_FSTYPES = frozenset({'tmpfs', 'devtmpfs', 'squashfs', 'overlay', 'fuse.gvfsd-fuse'})
+# 가상 파일시스템/런타임/스냅 마운트 아래는 디스크 사용량 의미가 없으므로 제외
+_PSEUDO_MOUNT_PREFIXES = ('/proc/', '/sys/', '/run/', '/snap/')
+
+
+def _is_pseudo_mount(mountpoint: str) -> bool:
+    return (mountpoint + '/').startswith(_PSEUDO_MOUNT_PREFIXES)
+
+
+def _list_partitions():
+    return [
+        p for p in psutil.disk_partitions()
+        if p.fstype not in _PSEUDO_FSTYPES and not _is_pseudo_mount(p.mountpoint)
+    ]
+
+
+# statvfs가 이 시간(초)을 넘긴 마운트는 일정 시간 건너뛰고,
+# 다시 느리면 건너뛰는 시간을 두 배로 늘린다(최대 DISK_USAGE_MAX_BACKOFF 초).
+# 호출이 반환된 뒤에 판단하므로, 아예 반환하지 않는(응답 없는 NFS 등) 마운트는 막지 못한다.
+DISK_USAGE_SLOW_THRESHOLD = 0.1
+DISK_USAGE_MIN_BACKOFF = float(os.getenv('DISK_USAGE_MIN_BACKOFF', '30'))
+DISK_USAGE_MAX_BACKOFF = float(os.getenv('DISK_USAGE_MAX_BACKOFF', '600'))
+_disk_usage_backoff = {}  # mountpoint -> (다시 시도할 단조 시각, 현재 대기 시간)
+
+
+def _disk_usage(mountpoint: str):
+    """psutil.disk_usage 결과를 반환하되, 느린 마운트는 백오프 동안 None을 반환한다."""
+    backoff = _disk_usage_backoff.get(mountpoint)
+    start = time.monotonic()
+    if backoff is not None and start < backoff[0]:
+        return None
+    usage = psutil.disk_usage(mountpoint)
+    elapsed = time.monotonic() - start
+    if elapsed > DISK_USAGE_SLOW_THRESHOLD:
+        if backoff is None:
+            delay = DISK_USAGE_MIN_BACKOFF
+        else:
+            delay = min(backoff[1] * 2, DISK_USAGE_MAX_BACKOFF)
+        _disk_usage_backoff[mountpoint] = (time.monotonic() + delay, delay)
+        logger.warning('disk_usage(%s) took %.3fs; skipping for %.0fs', mountpoint, elapsed, delay)
+    elif backoff is not None:
+        # 요청 경로와 수집 스레드에서 동시에 호출될 수 있으므로 pop 사용
+        _disk_usage_backoff.pop(mountpoint, None)
+    return usage
+
+
+def _thread_count():
+    """전체 스레드 수. 프로세스마다 상태 파일을 읽으므로 프로세스 수보다 훨씬 비싸다."""
+    thread_count = 0
+    # attrs를 지정하면 psutil이 프로세스별로 oneshot() 안에서 값을 읽는다
+    for proc in psutil.process_iter(['num_threads']):
+        thread_count += proc.info['num_threads'] or 0
+    return thread_count
+
+
+# 마운트 목록은 거의 바뀌지 않고, 프로세스 목록은 /proc 전체를 훑으므로 수집 주기보다 길게 캐시.
+# 스레드 수는 프로세스별 순회가 필요해 별도의 긴 주기로 갱신한다.
+_cached_partitions = _ttl_cache(_list_partitions, float(os.getenv('PARTITIONS_CACHE_TTL', '300')))
+_cached_process_count = _ttl_cache(lambda: len(psutil.pids()), float(os.getenv('PIDS_CACHE_TTL', '5')))
+_cached_thread_count = _ttl_cache(_thread_count, float(os.getenv('THREADS_CACHE_TTL', '60')))
+
+
+# 루프백/컨테이너 브리지/가상 인터페이스는 시계열만 늘리므로 제외
+_VIRTUAL_NIC_PATTERN = re.compile(r'^(lo|docker|veth|br-|virbr)')
+
+# 레이블 조합별 자식 게이지 캐시 (labels() 조회/락을 수집마다 반복하지 않음)
+_disk_children = {}
+_disk_slow_children = {}
+_network_children = {}
+# 인터페이스별 (직전 OS 카운터 값, 누적 Counter 값)
+_network_last = {}
+_network_totals = {}
+
+
+def _disk_child(mountpoint: str):
+    child = _disk_children.get(mountpoint)
+    if child is None:
+        child = g_disk_usage.labels(mountpoint=mountpoint)
+        _disk_children[mountpoint] = child
+    return child
+
+
+def _disk_slow_child(mountpoint: str):
+    children = _disk_slow_children.get(mountpoint)
+    if children is None:
+        children = (
+            g_disk_free.labels(mountpoint=mountpoint),
+            g_disk_total.labels(mountpoint=mountpoint),
+        )
+        _disk_slow_children[mountpoint] = children
+    return children
+
+
+def _remove_disk_children(mountpoint: str):
+    """백오프 중인 마운트의 시계열을 제거한다(마지막 값을 현재 값처럼 노출하지 않음)."""
+    if _disk_children.pop(mountpoint, None) is not None:
+        g_disk_usage.remove(mountpoint)
+    if _disk_slow_children.pop(mountpoint, None) is not None:
+        g_disk_free.remove(mountpoint)
+        g_disk_total.remove(mountpoint)
+
+
+def _network_child(interface: str):
+    children = _network_children.get(interface)
+    if children is None:
+        children = (
+            network_bytes_sent_total.labels(interface=interface),
+            network_bytes_recv_total.labels(interface=interface),
+            network_packets_sent_total.labels(interface=interface),
+            network_packets_recv_total.labels(interface=interface),
+        )
+        _network_children[interface] = children
+    return children
+
+
+# 마지막 수집 이후 이 간격(초) 안의 재호출은 건너뛴다(수집 스레드와 요청 경로의 중복 수집 방지)
+METRICS_MIN_INTERVAL = float(os.getenv('METRICS_MIN_INTERVAL', '1'))
+_last_sample_ts = None
+# 수집이 끝날 때마다 증가하는 세대 번호(직렬화 캐시 키). 수집 도중의 값이 캐시되지 않도록
+# 수집 시작 시각(_last_sample_ts) 대신 완료 후에 갱신한다.
+_sample_generation = 0
+# 첫 수집 완료 시 설정(그 전에는 게이지가 초기값 0이므로 /metrics 본문을 만들지 않음)
+_first_sample_done = threading.Event()
+_collect_lock = threading.Lock()
+# 직접 작성 경로에서 사용할 마지막 수집 값
+_system_sample = {}
+
+
+_MemSample = namedtuple('_MemSample', ['total', 'available', 'percent', 'used'])
+_PROC_MEMINFO = '/proc/meminfo'
+_HAS_PROC_MEMINFO = sys.platform.startswith('linux') and os.path.exists(_PROC_MEMINFO)
+
+
+def _read_meminfo():
+    """/proc/meminfo 앞쪽의 MemTotal/MemAvailable만 읽어 메모리 사용량을 계산한다.
+
+    used/percent 계산은 psutil(Linux)과 동일하게 total - available 기준이다.
+    값이 없거나 비정상이면 None을 반환한다.
+    """
+    total = available = None
+    with open(_PROC_MEMINFO, 'rb') as f:
+        for line in f:
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1]) * 1024
+                break
+    if not total or not available or available > total:
+        return None
+    used = total - available
+    return _MemSample(total, available, round(used / total * 100, 1), used)
+
 
-    mem = psutil.virtual_memory()
+def _virtual_memory():
+    if _HAS_PROC_MEMINFO:
+        mem = _read_meminfo()
+        if mem is not None:
+            return mem
+    # Linux 외 환경이나 MemAvailable이 없는 커널은 psutil 사용
+    return psutil.virtual_memory()
+
+
+# CPU 사용률은 cpu_times() 누적값의 차이로 직접 계산한다. psutil.cpu_percent(interval=None)의
+# 기준점은 호출한 스레드별로 관리되어, 메인 스레드에서 잡은 기준점이 수집 스레드에 적용되지 않는다.
+# 측정 구간이 너무 짧으면(시작 직후 등) 값이 0 또는 100 근처로 튀므로, 최소 구간이 지나기 전에는 갱신하지 않는다.
+_CPU_MIN_WINDOW = 0.5
+_cpu_baseline = None  # (단조 시각, busy 누적, total 누적)
+
+
+def _cpu_busy_total():
+    times = psutil.cpu_times()
+    # psutil과 동일하게 guest 시간은 user/nice에 이미 포함되어 있어 제외하고, iowait는 유휴로 본다
+    total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+    busy = total - times.idle - getattr(times, 'iowait', 0.0)
+    return busy, total
+
+
+def _prime_cpu_percent():
+    global _cpu_baseline
+    _cpu_baseline = (time.monotonic(), *_cpu_busy_total())
+
+
+def _sample_cpu_percent():
+    """직전 기준점 이후의 CPU 사용률을 반환한다.
+
+    구간이 _CPU_MIN_WINDOW 초보다 짧으면 기다리지 않고 None을 반환하며(직전 값 유지),
+    이때 기준점은 그대로 두어 다음 호출의 구간에 포함시킨다.
+    """
+    global _cpu_baseline
+    if _cpu_baseline is None:
+        _prime_cpu_percent()
+        return None
+    baseline_ts, last_busy, last_total = _cpu_baseline
+    if time.monotonic() - baseline_ts < _CPU_MIN_WINDOW:
+        return None
+    busy, total = _cpu_busy_total()
+    _cpu_baseline = (time.monotonic(), busy, total)
+    total_delta = total - last_total
+    if total_delta <= 0:
+        return 0.0
+    busy_delta = min(max(busy - last_busy, 0.0), total_delta)
+    return round(busy_delta / total_delta * 100, 1)
+
+
+def collect_system_metrics():
+    global _last_sample_ts, _sample_generation
+    # 다른 스레드가 이미 수집 중이면 기다리지 않고 그 결과(파일/캐시된 본문)를 재사용
+    if not _collect_lock.acquire(blocking=False):
+        return
+    try:
+        now = time.monotonic()
+        if _last_sample_ts is not None and now - _last_sample_ts < METRICS_MIN_INTERVAL:
+            return
+        _last_sample_ts = now
+        _sample_system_metrics()
+        _sample_generation += 1
+        _first_sample_done.set()
+    finally:
+        _collect_lock.release()
+
+
+def _sample_system_metrics():
+    global _system_sample
+    cpu_percent = _sample_cpu_percent()
+    if cpu_percent is None:
+        cpu_percent = _system_sample.get('cpu_percent', 0.0)
+    else:
+        g_cpu.set(cpu_percent)
+
+    mem = _virtual_memory()
     g_mem.set(mem.percent)
     g_mem_available.set(mem.available)
-    g_mem_total.set(mem.total)
     g_mem_used.set(mem.used)
 
-    for partition in psutil.disk_partitions():
+    disk_usage = []
+    for partition in _cached_partitions():
         try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            g_disk_usage.labels(device=partition.device, mountpoint=partition.mountpoint).set(usage.percent)
-            g_disk_free.labels(device=partition.device, mountpoint=partition.mountpoint).set(usage.free)
-            g_disk_total.labels(device=partition.device, mountpoint=partition.mountpoint).set(usage.total)
+            usage = _disk_usage(partition.mountpoint)
         except (PermissionError, FileNotFoundError):
             continue
+        if usage is None:
+            _remove_disk_children(partition.mountpoint)
+            continue
+        _disk_child(partition.mountpoint).set(usage.percent)
+        disk_usage.append((partition.mountpoint, usage.percent))
 
-    net_io = psutil.net_io_counters(pernic=True)
+    net_io = {
+        interface: stats
+        for interface, stats in psutil.net_io_counters(pernic=True).items()
+        if not _VIRTUAL_NIC_PATTERN.match(interface)
+    }
+    net_totals = {}
     for interface, stats in net_io.items():
-        g_network_bytes_sent.labels(interface=interface).set(stats.bytes_sent)
-        g_network_bytes_recv.labels(interface=interface).set(stats.bytes_recv)
-        g_network_packets_sent.labels(interface=interface).set(stats.packets_sent)
-        g_network_packets_recv.labels(interface=interface).set(stats.packets_recv)
+        current = (stats.bytes_sent, stats.bytes_recv, stats.packets_sent, stats.packets_recv)
+        last = _network_last.get(interface, (0, 0, 0, 0))
+        totals = list(_network_totals.get(interface, (0, 0, 0, 0)))
+        for i, child in enumerate(_network_child(interface)):
+            delta = current[i] - last[i]
+            if delta < 0:
+                # OS 카운터가 초기화된 경우 초기화 이후 값만 더함
+                delta = current[i]
+            if delta:
+                child.inc(delta)
+                totals[i] += delta
+        _network_last[interface] = current
+        _network_totals[interface] = net_totals[interface] = tuple(totals)
+
+    process_count = _cached_process_count()
+    thread_count = _cached_thread_count()
+    g_process_count.set(process_count)
+    g_thread_count.set(thread_count)
+
+    _system_sample = {
+        'cpu_percent': cpu_percent,
+        'mem': mem,
+        'disk_usage': disk_usage,
+        'net_totals': net_totals,
+        'process_count': process_count,
+        'thread_count': thread_count,
+    }
+
+
+_slow_sample_ts = None
+
+
+def collect_slow_metrics():
+    global _slow_sample_ts
+    for partition in _cached_partitions():
+        try:
+            usage = _disk_usage(partition.mountpoint)
+            if usage is None:
+                _remove_disk_children(partition.mountpoint)
+                continue
+            free_child, total_child = _disk_slow_child(partition.mountpoint)
+            free_child.set(usage.free)
+            total_child.set(usage.total)
+        except (PermissionError, FileNotFoundError):
+            continue
+    # 캐시 키는 값을 모두 반영한 뒤에 갱신
+    _slow_sample_ts = time.monotonic()
+
+
+def _metric_header(metric, suffix: str = '', metric_type: str = '') -> str:
+    desc = metric.describe()[0]
+    name = desc.name + suffix
+    return f"# HELP {name} {desc.documentation}\n# TYPE {name} {metric_type or desc.type}\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+# 메트릭별 HELP/TYPE 헤더는 한 번만 만들어 둔다
+_FAST_HEADERS = {
+    metric: _metric_header(metric)
+    for metric in (
+        g_camera_value, g_ocr_seconds, g_hdmi_value, g_ac_value, g_dc_value,
+        g_cpu, g_mem, g_mem_available, g_mem_used, g_disk_usage,
+        g_process_count, g_thread_count,
+    )
+}
+for _counter in (network_bytes_sent_total, network_bytes_recv_total, network_packets_sent_total, network_packets_recv_total):
+    _FAST_HEADERS[_counter] = _metric_header(_counter, suffix='_total')
+_FAST_HEADERS[info_ocr_value] = _metric_header(info_ocr_value, suffix='_info', metric_type='gauge')
+
+_FAST_STATUS_GAUGES = (
+    (g_camera_value, 'camera_value', 'camera_value'),
+    (g_ocr_seconds, 'ocr_value_seconds', 'ocr_value'),
+    (g_hdmi_value, 'hdmi_value', 'hdmi_value'),
+    (g_ac_value, 'ac_value', 'ac_value'),
+    (g_dc_value, 'dc_value', 'dc_value'),
+)
+_FAST_NETWORK_COUNTERS = (
+    (network_bytes_sent_total, 'system_network_bytes_sent_total'),
+    (network_bytes_recv_total, 'system_network_bytes_recv_total'),
+    (network_packets_sent_total, 'system_network_packets_sent_total'),
+    (network_packets_recv_total, 'system_network_packets_recv_total'),
+)
+
+
+def _render_metrics_fast() -> bytes:
+    """장비 상태와 시스템 게이지를 Prometheus 텍스트 포맷으로 직접 작성한다."""
+    status = _get_status_snapshot()
+    sample = _system_sample
+    out = []
+
+    for metric, name, field in _FAST_STATUS_GAUGES:
+        out.append(_FAST_HEADERS[metric])
+        out.append(f"{name} {floatToGoString(status[field])}\n")
+    out.append(_FAST_HEADERS[info_ocr_value])
+    out.append(f'ocr_value_info{{value="{_epoch_seconds_to_hms_kst(status["ocr_value"])}"}} 1.0\n')
+
+    if sample:
+        mem = sample['mem']
+        for metric, name, value in (
+            (g_cpu, 'system_cpu_percent', sample['cpu_percent']),
+            (g_mem, 'system_memory_percent', mem.percent),
+            (g_mem_available, 'system_memory_available_bytes', mem.available),
+            (g_mem_used, 'system_memory_used_bytes', mem.used),
+        ):
+            out.append(_FAST_HEADERS[metric])
+            out.append(f"{name} {floatToGoString(value)}\n")
+
+        out.append(_FAST_HEADERS[g_disk_usage])
+        for mountpoint, percent in sample['disk_usage']:
+            out.append(
+                f'system_disk_usage_percent{{mountpoint="{_escape_label(mountpoint)}"}} '
+                f'{floatToGoString(percent)}\n'
+            )
+
+        net_totals = sample['net_totals']
+        for i, (metric, name) in enumerate(_FAST_NETWORK_COUNTERS):
+            out.append(_FAST_HEADERS[metric])
+            for interface, totals in net_totals.items():
+                out.append(
+                    f'{name}{{interface="{_escape_label(interface)}"}} '
+                    f'{floatToGoString(totals[i])}\n'
+                )
+
+        out.append(_FAST_HEADERS[g_process_count])
+        out.append(f"system_process_count {floatToGoString(sample['process_count'])}\n")
+        out.append(_FAST_HEADERS[g_thread_count])
+        out.append(f"system_thread_count {floatToGoString(sample['thread_count'])}\n")
+
+    return ''.join(out).encode('utf-8')
+
+
+def _write_metrics_file():
+    data = _render_metrics_fast() if METRICS_FAST_RENDER else generate_latest()
+    with _metrics_file_lock:
+        fd, tmp_path = tempfile.mkstemp(dir=_METRICS_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, METRICS_FILE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# 레지스트리별 직렬화 결과 캐시: {키: (캐시 키, 본문)}
+_exposition_cache = {}
+
+
+def _cached_exposition(key: str, registry, sample_key):
+    """같은 수집 결과에 대해서는 generate_latest()를 다시 호출하지 않는다."""
+    cached = _exposition_cache.get(key)
+    if cached is not None and cached[0] == sample_key:
+        return cached[1]
+    body = generate_latest(registry)
+    _exposition_cache[key] = (sample_key, body)
+    return body
+
+
+def _remove_metrics_dir():
+    shutil.rmtree(_METRICS_DIR, ignore_errors=True)
 
-    g_process_count.set(len(psutil.pids()))
-    g_thread_count.set(psutil.cpu_count() or 0)
-    g_boot_time.set(psutil.boot_time())
+
+atexit.register(_remove_metrics_dir)
 
 
 def _initialize_metrics():
@@ -233,139 +846,199 @@ def _initialize_metrics():
 
 _initialize_metrics()
 
+# CPU 사용률은 직전 기준점 대비 값이므로 첫 수집이 0.0이 되지 않도록 기준점을 잡아 둔다
+_prime_cpu_percent()
+
+# 부팅 시각과 전체 메모리는 프로세스 수명 동안 (사실상) 변하지 않으므로 한 번만 설정
+g_boot_time.set(psutil.boot_time())
+g_mem_total.set(_virtual_memory().total)
+
+
+def _json(obj, status: int = 200):
+    # 표준 json 기반 jsonify 대신 orjson으로 직렬화
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 
 @app.route('/metrics')
-@http_request_duration.time()
 def metrics():
-    collect_system_metrics()
-    http_requests_total.labels(method='GET', endpoint='/metrics', status='200').inc()
-    data = generate_latest()
-    return Response(data, mimetype=CONTENT_TYPE_LATEST)
+    if not os.path.exists(METRICS_FILE_PATH):
+        # 수집 스레드가 아직 첫 파일을 쓰기 전이면 첫 수집 완료를 기다린다
+        # (채워지지 않은 0 값 게이지를 내보내면 메모리 부족 등 경보가 오동작할 수 있음)
+        _first_sample_done.wait(METRICS_COLLECT_INTERVAL)
+        if _sample_generation == 0:
+            _req_metrics_503.inc()
+            return Response('metrics not ready\n', status=503, mimetype='text/plain')
+        if not os.path.exists(METRICS_FILE_PATH):
+            _write_metrics_file()
+    _req_metrics_200.inc()
+    # 스크레이프마다 압축하는 비용을 피하기 위해 비압축 본문을 그대로 전달
+    resp = send_file(METRICS_FILE_PATH, conditional=False, etag=False)
+    resp.headers['Content-Type'] = CONTENT_TYPE_LATEST
+    resp.headers['Content-Encoding'] = 'identity'
+    del resp.headers['Content-Disposition']
+    return resp
+
+
+@app.route('/metrics/full')
+def metrics_full():
+    _req_metrics_full_200.inc()
+    # 기본 레지스트리에는 상태 게이지도 있으므로 상태 스냅샷(copy-on-write)도 키에 포함
+    body = _cached_exposition('full', REGISTRY, (_sample_generation, _get_status_snapshot()))
+    # mimetype=은 charset을 한 번 더 붙이므로 Content-Type을 그대로 지정
+    resp = Response(body, content_type=CONTENT_TYPE_LATEST)
+    resp.headers['Content-Encoding'] = 'identity'
+    return resp
+
+
+@app.route('/metrics/slow')
+def metrics_slow():
+    _req_metrics_slow_200.inc()
+    body = _cached_exposition('slow', slow_registry, _slow_sample_ts)
+    # mimetype=은 charset을 한 번 더 붙이므로 Content-Type을 그대로 지정
+    resp = Response(body, content_type=CONTENT_TYPE_LATEST)
+    resp.headers['Content-Encoding'] = 'identity'
+    return resp
 
 
 @app.route('/status', methods=['POST'])
 @http_request_duration.time()
 def update_status():
+    data = request.get_json(force=True, silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    if 'status' in data and 'camera_value' not in data:
+        data['camera_value'] = data['status']
     try:
-        data = request.get_json(force=True, silent=True) or {}
-        if 'status' in data and 'camera_value' not in data:
-            data['camera_value'] = data['status']
         updated_fields = _apply_updates(data)
-        response = {
-            'status': _get_status_snapshot(),
-            'updated_fields': list(updated_fields.keys()),
-            'timestamp': time.time(),
-        }
-        http_requests_total.labels(method='POST', endpoint='/status', status='200').inc()
-        return jsonify(response), 200
     except ValueError as exc:
-        http_requests_total.labels(method='POST', endpoint='/status', status='400').inc()
-        return jsonify({'error': str(exc)}), 400
-    except Exception as exc:  # pragma: no cover
-        http_requests_total.labels(method='POST', endpoint='/status', status='500').inc()
-        return jsonify({'error': str(exc)}), 500
+        _req_status_post_400.inc()
+        return _json({'error': str(exc)}, 400)
+    _req_status_post_200.inc()
+    return _json({
+        'status': _get_status_snapshot(),
+        'updated_fields': list(updated_fields.keys()),
+        'timestamp': time.time(),
+    }, 200)
 
 
 @app.route('/status', methods=['GET'])
 @http_request_duration.time()
 def get_status():
-    try:
-        http_requests_total.labels(method='GET', endpoint='/status', status='200').inc()
-        return jsonify({
-            'status': _get_status_snapshot(),
-            'timestamp': time.time(),
-        }), 200
-    except Exception as exc:  # pragma: no cover
-        http_requests_total.labels(method='GET', endpoint='/status', status='500').inc()
-        return jsonify({'error': str(exc)}), 500
+    _req_status_get_200.inc()
+    return _json({
+        'status': _get_status_snapshot(),
+        'timestamp': time.time(),
+    }, 200)
 
 
 @app.route('/status/update', methods=['GET'])
 @http_request_duration.time()
 def update_status_via_get():
     try:
-        query_params = request.args.to_dict()
-        updated_fields = _apply_updates(query_params)
-        response = {
-            'status': _get_status_snapshot(),
-            'updated_fields': list(updated_fields.keys()),
-            'timestamp': time.time(),
-        }
-        http_requests_total.labels(method='GET', endpoint='/status/update', status='200').inc()
-        return jsonify(response), 200
+        updated_fields = _apply_updates(request.args.to_dict())
     except ValueError as exc:
-        http_requests_total.labels(method='GET', endpoint='/status/update', status='400').inc()
-        return jsonify({'error': str(exc)}), 400
-    except Exception as exc:  # pragma: no cover
-        http_requests_total.labels(method='GET', endpoint='/status/update', status='500').inc()
-        return jsonify({'error': str(exc)}), 500
+        _req_status_update_400.inc()
+        return _json({'error': str(exc)}, 400)
+    _req_status_update_200.inc()
+    return _json({
+        'status': _get_status_snapshot(),
+        'updated_fields': list(updated_fields.keys()),
+        'timestamp': time.time(),
+    }, 200)
+
+
+@app.errorhandler(InternalServerError)
+def _handle_internal_error(exc):
+    # 핸들러에서 처리하지 못한 예외는 여기서 한 번에 500으로 응답/집계
+    original = exc.original_exception or exc
+    endpoint = request.url_rule.rule if request.url_rule else request.path
+    children = _REQ.get((request.method, endpoint))
+    if children is not None:
+        children['500'].inc()
+    else:
+        http_requests_total.labels(method=request.method, endpoint=endpoint, status='500').inc()
+    return _json({'error': str(original)}, 500)
+
+
+# index.html은 요청에 따라 달라지는 내용이 없으므로 시작 시 한 번만 렌더링
+with app.app_context():
+    _INDEX_HTML = render_template('index.html')
 
 
 @app.route('/')
-@http_request_duration.time()
 def index():
-    http_requests_total.labels(method='GET', endpoint='/', status='200').inc()
-    return render_template('index.html')
+    _req_index_200.inc()
+    return Response(_INDEX_HTML, mimetype='text/html')
 
 
-def _fetch_json(url: str, timeout: float = 3.0):
+async def _fetch_json(session: aiohttp.ClientSession, url: str):
     try:
-        with urlrequest.urlopen(url, timeout=timeout) as resp:
+        async with session.get(url) as resp:
             if resp.status != 200:
                 return None
-            data = resp.read().decode('utf-8')
-            return json.loads(data)
-    except (URLError, HTTPError, TimeoutError, json.JSONDecodeError):
+            return orjson.loads(await resp.read())
+    except asyncio.TimeoutError:
+        # 타임아웃은 호출 측에서 별도로 로깅
+        raise
+    except (aiohttp.ClientError, ValueError):
         return None
 
 
-def _poll_devices_loop():
-    host_default = os.getenv('DEVICE_HOST', '127.0.0.1')
-    hosts = {
-        'camera': os.getenv('CAMERA_HOST', host_default),
-        'hdmi': os.getenv('HDMI_HOST', host_default),
-        'ocr': os.getenv('OCR_HOST', host_default),
-        'ac': os.getenv('AC_HOST', host_default),
-        'dc': os.getenv('DC_HOST', host_default),
-    }
-    ports = {
-        'camera': int(os.getenv('CAMERA_PORT', '5001')),
-        'hdmi': int(os.getenv('HDMI_PORT', '5002')),
-        'ocr': int(os.getenv('OCR_PORT', '5003')),
-        'ac': int(os.getenv('AC_PORT', '5004')),
-        'dc': int(os.getenv('DC_PORT', '5005')),
-    }
+# 장비 폴링 주기(초)
+DEVICE_POLL_INTERVAL = float(os.getenv('DEVICE_POLL_INTERVAL', '5'))
 
-    # 실행 중 재사용할 스레드 풀 (최대 동시 5개)
-    executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix='fetch')
 
-    while True:
-        try:
-            payload = {}
-
-            # 요청 대상과 기대 키 매핑
-            targets = {
-                'camera': (f"http://{hosts['camera']}:{ports['camera']}/status", 'camera_value'),
-                'hdmi': (f"http://{hosts['hdmi']}:{ports['hdmi']}/status", 'hdmi_value'),
-                'ocr': (f"http://{hosts['ocr']}:{ports['ocr']}/status", 'ocr_value'),
-                'ac': (f"http://{hosts['ac']}:{ports['ac']}/status", 'ac_value'),
-                'dc': (f"http://{hosts['dc']}:{ports['dc']}/status", 'dc_value'),
-            }
-
-            futures = {}
-            for name, (url, expect_key) in targets.items():
-                fut = executor.submit(_fetch_json, url)
-                futures[fut] = (name, expect_key)
-
-            completed_names = set()
+def _advance_tick(next_tick: float, interval: float, now: float) -> float:
+    """고정 주기의 다음 실행 시각을 구한다. 처리 지연으로 놓친 주기는 건너뛴다."""
+    next_tick += interval
+    if next_tick <= now:
+        next_tick += (int((now - next_tick) // interval) + 1) * interval
+    return next_tick
+
+
+def _build_poll_targets():
+    """환경 변수에서 장비별 (이름, URL, 기대 키) 목록을 한 번만 구성한다."""
+    host_default = os.getenv('DEVICE_HOST', '127.0.0.1')
+    devices = (
+        ('camera', 'CAMERA', '5001', 'camera_value'),
+        ('hdmi', 'HDMI', '5002', 'hdmi_value'),
+        ('ocr', 'OCR', '5003', 'ocr_value'),
+        ('ac', 'AC', '5004', 'ac_value'),
+        ('dc', 'DC', '5005', 'dc_value'),
+    )
+    targets = []
+    for name, env_prefix, default_port, expect_key in devices:
+        host = os.getenv(f'{env_prefix}_HOST', host_default)
+        port = int(os.getenv(f'{env_prefix}_PORT', default_port))
+        targets.append((name, f"http://{host}:{port}/status", expect_key))
+    return tuple(targets)
+
+
+async def _poll_devices_async():
+    # 요청 대상과 기대 키 매핑 (루프 밖에서 한 번만 생성)
+    targets = _build_poll_targets()
+
+    # 실행 중 재사용할 세션 (keep-alive로 대상별 연결 재사용, 요청당 최대 3초)
+    timeout = aiohttp.ClientTimeout(total=3.0)
+    connector = aiohttp.TCPConnector(limit=8)
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        while True:
             try:
-                for fut in as_completed(futures, timeout=3.0):
-                    name, expect_key = futures[fut]
-                    completed_names.add(name)
-                    try:
-                        data = fut.result()
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("%s 서버 요청 실패: %s", name, exc)
+                payload = {}
+
+                results = await asyncio.gather(
+                    *(_fetch_json(session, url) for _name, url, _expect_key in targets),
+                    return_exceptions=True,
+                )
+
+                for (name, _url, expect_key), data in zip(targets, results):
+                    if isinstance(data, asyncio.TimeoutError):
+                        logger.warning("%s 서버 요청 타임아웃", name)
+                        continue
+                    if isinstance(data, BaseException):
+                        logger.warning("%s 서버 요청 실패: %s", name, data)
                         continue
 
                     if data and expect_key in data:
@@ -373,29 +1046,39 @@ def _poll_devices_loop():
                         logger.info("%s 서버 값 수집 성공: %s", name, data[expect_key])
                     else:
                         logger.warning("%s 서버 값 수집 실패: %s", name, data)
-            except FuturesTimeout:
-                # 타임아웃으로 완료 못한 작업 로깅
-                pass
-
-            # 타임아웃 등으로 미완료된 대상 경고 처리
-            for name, (_url, expect_key) in targets.items():
-                if name not in completed_names:
-                    logger.warning("%s 서버 요청 타임아웃", name)
-
-            if payload:
-                try:
-                    _apply_updates(payload)
-                except ValueError as exc:
-                    logger.warning("수집 데이터 적용 실패: %s", exc)
-        except Exception:
-            logger.exception("장비 폴링 루프 처리 중 예외 발생")
 
-        time.sleep(5)
+                if payload:
+                    try:
+                        _apply_updates(payload)
+                    except ValueError as exc:
+                        logger.warning("수집 데이터 적용 실패: %s", exc)
+            except Exception:
+                logger.exception("장비 폴링 루프 처리 중 예외 발생")
+
+            # 처리 시간과 무관하게 주기가 밀리지 않도록 시작 시각 기준으로 대기
+            now = loop.time()
+            next_tick = _advance_tick(next_tick, DEVICE_POLL_INTERVAL, now)
+            await asyncio.sleep(next_tick - now)
+
+
+def _poll_devices_loop():
+    # 폴링 전용 스레드에서 단일 이벤트 루프로 모든 장비를 동시에 조회
+    asyncio.run(_poll_devices_async())
 
 
 _poller_started = False
 _poller_lock = threading.Lock()
 
+# 시스템 메트릭 수집 주기(초). /metrics 요청 경로에서는 psutil을 호출하지 않는다.
+METRICS_COLLECT_INTERVAL = float(os.getenv('METRICS_COLLECT_INTERVAL', '5'))
+# /metrics/slow 메트릭 수집 주기(초)
+SLOW_METRICS_INTERVAL = float(os.getenv('SLOW_METRICS_INTERVAL', '60'))
+_collector_started = False
+_collector_thread = None
+_collector_lock = threading.Lock()
+_collector_stop = threading.Event()
+
+
 def _start_poller_thread_once():
     global _poller_started
     with _poller_lock:
@@ -405,12 +1088,59 @@ def _start_poller_thread_once():
         t.start()
         _poller_started = True
 
-@app.before_request
-def _ensure_poller_started():
-    _start_poller_thread_once()
+
+def _collect_metrics_loop():
+    # 시작 시 잡은 CPU 기준점 이후 최소 측정 구간이 지난 뒤 첫 수집을 해야 CPU 값이 채워진다
+    _collector_stop.wait(_CPU_MIN_WINDOW)
+    next_slow_collect = 0.0
+    next_tick = time.monotonic()
+    while not _collector_stop.is_set():
+        try:
+            collect_system_metrics()
+            _write_metrics_file()
+        except Exception:
+            logger.exception("시스템 메트릭 수집 중 예외 발생")
+        if time.monotonic() >= next_slow_collect:
+            try:
+                collect_slow_metrics()
+            except Exception:
+                logger.exception("저빈도 시스템 메트릭 수집 중 예외 발생")
+            next_slow_collect = time.monotonic() + SLOW_METRICS_INTERVAL
+        # 수집에 걸린 시간만큼 주기가 밀리지 않도록 고정 주기(next_tick) 기준으로 대기
+        now = time.monotonic()
+        next_tick = _advance_tick(next_tick, METRICS_COLLECT_INTERVAL, now)
+        _collector_stop.wait(next_tick - now)
+
+
+def _start_metrics_collector_thread_once():
+    global _collector_started, _collector_thread
+    with _collector_lock:
+        if _collector_started:
+            return
+        t = threading.Thread(target=_collect_metrics_loop, name='metrics-collector', daemon=True)
+        t.start()
+        _collector_thread = t
+        _collector_started = True
+
+
+def _stop_metrics_collector():
+    # 종료 시 수집 루프를 멈추고, 메트릭 디렉터리 삭제 전에 진행 중인 파일 쓰기를 기다린다
+    _collector_stop.set()
+    if _collector_thread is not None:
+        _collector_thread.join(timeout=2.0)
+
+
+# atexit은 등록 역순으로 실행되므로 _remove_metrics_dir보다 먼저 호출된다
+atexit.register(_stop_metrics_collector)
+
+
+# 모듈 로드 시 한 번만 백그라운드 스레드 시작 (요청마다 락을 잡고 확인하지 않음)
+_start_poller_thread_once()
+_start_metrics_collector_thread_once()
 
 
 if __name__ == '__main__':
+    import signal
     import webbrowser
     from threading import Timer
 
@@ -418,4 +1148,18 @@ if __name__ == '__main__':
         webbrowser.open('http://localhost:5000')
 
     Timer(0.5, open_browser).start()
-    app.run(host='0.0.0.0', port=5000, debug=True)
+
+    # docker stop/systemctl stop의 SIGTERM 기본 동작은 atexit을 건너뛰므로,
+    # SystemExit으로 바꿔 수집 스레드 중지와 메트릭 디렉터리 정리가 실행되게 한다
+    def _handle_sigterm(signum, frame):
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    if os.getenv('FLASK_DEV'):
+        # 개발용: 리로더는 모듈 로드 시 시작하는 백그라운드 스레드를 중복 실행하므로 끈다
+        app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
+    else:
+        from waitress import serve
+
+        # 개발 서버 대신 스레드 풀 기반 WSGI 서버로 실행 (스크레이프와 상태 갱신이 서로 막지 않도록)
+        serve(app, host='0.0.0.0', port=5000, threads=int(os.getenv('WEB_THREADS', '8')))